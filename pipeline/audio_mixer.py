@@ -6,11 +6,32 @@ so there is no command injection risk.
 """
 
 import asyncio
+import glob
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger("ramayana-engine")
 
+MUSIC_CACHE_DIR = Path.home() / ".cache" / "ramayana-engine" / "music"
+MUSIC_DEFAULT_VOLUME = 0.3
+MUSIC_DEFAULT_FADE_MS = 2000
+# Cached beds are rounded up to this length so jittery cue timings share one bed
+MUSIC_BED_GRID_S = 60
+
+# Upper bound on inputs per ffmpeg mix job and on concurrent submix jobs
+MIX_CHUNK_SIZE = 32
+MIX_MAX_PARALLEL = min(os.cpu_count() or 2, 4)
+
+# PCM piped from narration windows to the streaming encoder (Edge TTS: 24 kHz mono)
+STEM_SAMPLE_RATE = 24000
+STEM_FORMAT = f"aformat=sample_fmts=s16:sample_rates={STEM_SAMPLE_RATE}:channel_layouts=mono"
+
 
 async def build_narration_track(
     narration_results: list,
@@ -18,34 +39,93 @@ async def build_narration_track(
     output_path: Path,
 ) -> Path:
     """Position narration clips at their beat timestamps using ffmpeg adelay."""
-    inputs = []
-    filters = []
-    valid_count = 0
+    clips = [
+        _Clip(path=result.audio_path, delay_ms=int(timestamp_ms))
+        for result, timestamp_ms in zip(narration_results, narration_timestamps)
+        if result.duration_ms > 0
+    ]
 
-    for i, (result, timestamp_ms) in enumerate(zip(narration_results, narration_timestamps)):
-        if result.duration_ms == 0:
-            continue
+    if not clips:
+        await _create_silence(output_path, 1.0)
+        return output_path
+
+    await _mix_clips(clips, output_path)
+    return output_path
 
-        delay = int(timestamp_ms)
-        inputs.extend(["-i", str(result.audio_path)])
-        filters.append(f"[{valid_count}]adelay={delay}|{delay}[a{valid_count}]")
-        valid_count += 1
 
-    if valid_count == 0:
+async def build_narration_track_streaming(
+    clips: Iterable[tuple[Path, float]],
+    output_path: Path,
+    delete_inputs: bool = False,
+) -> Path:
+    """Build the narration track window by window through one streaming encoder.
+
+    clips yields (audio_path, timestamp_ms) in timeline order and is
+    consumed lazily. Every MIX_CHUNK_SIZE clips are mixed into a window
+    padded to exactly the gap before the next window. Its raw samples are
+    piped into a single long-running AAC encoder, so window boundaries
+    cannot drift and no uncompressed stem is written to disk. With
+    delete_inputs, each window's clips are removed once encoded.
+    """
+    window: list[_Clip] = []
+    window_start_ms = 0
+    windows = 0
+    encoder = None
+
+    async def flush(end_ms: int | None) -> None:
+        nonlocal encoder
+        if end_ms is None:
+            post = f",{STEM_FORMAT}"
+        else:
+            samples = (end_ms - window_start_ms) * STEM_SAMPLE_RATE // 1000
+            post = f",{STEM_FORMAT},apad=whole_len={samples},atrim=end_sample={samples}"
+        if encoder is None:
+            encoder = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-y", "-nostats",
+                "-f", "s16le", "-ar", str(STEM_SAMPLE_RATE), "-ac", "1",
+                "-i", "pipe:0",
+                "-c:a", "aac",
+                str(output_path),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        await _pipe_ffmpeg(
+            _mix_args(window, window_start_ms, "pipe:1", ["-f", "s16le"], post_filter=post),
+            encoder.stdin,
+        )
+        if delete_inputs:
+            for clip in window:
+                clip.path.unlink(missing_ok=True)
+
+    try:
+        for audio_path, timestamp_ms in clips:
+            delay = int(timestamp_ms)
+            if len(window) == MIX_CHUNK_SIZE:
+                await flush(delay)
+                windows += 1
+                window, window_start_ms = [], delay
+            window.append(_Clip(path=audio_path, delay_ms=delay))
+        if window:
+            await flush(None)
+            windows += 1
+
+        if encoder is not None:
+            encoder.stdin.close()
+            _, stderr = await encoder.communicate()
+            if encoder.returncode != 0:
+                raise RuntimeError(f"ffmpeg failed: {stderr.decode()[-500:]}")
+    except BaseException:
+        if encoder is not None and encoder.returncode is None:
+            encoder.kill()
+            await encoder.wait()
+        raise
+
+    if windows == 0:
         await _create_silence(output_path, 1.0)
         return output_path
 
-    mix_inputs = "".join(f"[a{i}]" for i in range(valid_count))
-    filters.append(f"{mix_inputs}amix=inputs={valid_count}:normalize=0[narration]")
-
-    cmd = [
-        *inputs,
-        "-filter_complex", ";".join(filters),
-        "-map", "[narration]",
-        "-c:a", "aac",
-        str(output_path),
-    ]
-    await _run_ffmpeg(cmd)
+    logger.debug(f"Narration track: {windows} windows streamed into {output_path.name}")
     return output_path
 
 
@@ -54,35 +134,210 @@ async def build_music_track(
     assets_dir: Path,
     total_duration_s: float,
     output_path: Path,
+    cache_dir: Path | None = None,
 ) -> Path:
-    """Build the background music track from music cues with fading."""
-    if not music_cues:
-        await _create_silence(output_path, total_duration_s)
-        return output_path
-
-    first_cue = music_cues[0]
-    music_file = assets_dir / "audio" / "music" / f"{first_cue['clip']}.mp3"
+    """Build the background music timeline from every music cue in one pass.
 
-    if not music_file.exists():
-        logger.warning(f"Music file not found: {music_file}, creating silence")
+    Each cue plays from its wall-clock timestamp until the next cue,
+    crossfading over the incoming cue's fade_in. Each track is looped
+    into a single cached bed (see _get_music_bed); trimming, fades,
+    volume and positioning all happen in one ffmpeg mix job.
+    """
+    segments = _plan_music_segments(music_cues, assets_dir, total_duration_s)
+    if not segments:
         await _create_silence(output_path, total_duration_s)
         return output_path
 
-    volume = first_cue.get("volume", 0.3)
-    fade_in = first_cue.get("fade_in", 2000) / 1000
-    fade_out_start = max(total_duration_s - 2, 0)
+    cache_dir = cache_dir or MUSIC_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    needed_ms: dict[Path, int] = {}
+    for seg in segments:
+        needed_ms[seg.music_file] = max(needed_ms.get(seg.music_file, 0), seg.length_ms)
+    bed_list = await _gather_or_cancel(*(
+        _get_music_bed(music_file, length_ms, cache_dir)
+        for music_file, length_ms in needed_ms.items()
+    ))
+    beds = dict(zip(needed_ms, bed_list))
 
-    await _run_ffmpeg([
-        "-stream_loop", "-1",
-        "-i", str(music_file),
-        "-t", str(total_duration_s),
-        "-af", f"afade=t=in:d={fade_in},afade=t=out:st={fade_out_start}:d=2,volume={volume}",
-        "-c:a", "aac",
-        str(output_path),
-    ])
+    clips = [
+        _Clip(
+            path=beds[segment.music_file],
+            delay_ms=segment.start_ms,
+            volume=segment.volume,
+            pre_filter=_segment_filter(segment),
+        )
+        for segment in segments
+    ]
+    await _run_ffmpeg(_mix_args(
+        clips, 0, output_path, ["-t", str(total_duration_s), "-c:a", "aac"]
+    ))
+    logger.debug(f"Music timeline: {len(segments)} segments over {total_duration_s:.1f}s")
     return output_path
 
 
+@dataclass
+class _MusicSegment:
+    music_file: Path
+    start_ms: int
+    length_ms: int
+    volume: float
+    fade_in_ms: int
+    fade_out_ms: int
+
+
+def _plan_music_segments(
+    music_cues: list[dict],
+    assets_dir: Path,
+    total_duration_s: float,
+) -> list[_MusicSegment]:
+    """Turn the music cue log into non-overlapping beds with crossfade tails.
+
+    Cues whose file is missing are dropped (the previous track keeps
+    playing), and a cue repeating the track and volume already playing
+    is treated as a continuation rather than a restart.
+    """
+    total_ms = int(total_duration_s * 1000)
+    cues = []
+    for cue in sorted(music_cues, key=lambda c: c["wall_clock_ms"]):
+        music_file = assets_dir / "audio" / "music" / f"{cue['clip']}.mp3"
+        if not music_file.exists():
+            logger.warning(f"Music file not found: {music_file}, skipping cue")
+            continue
+        start_ms = min(max(int(cue["wall_clock_ms"]), 0), total_ms)
+        volume = cue.get("volume")
+        volume = MUSIC_DEFAULT_VOLUME if volume is None else volume
+        fade_in_ms = cue.get("fade_in")
+        fade_in_ms = MUSIC_DEFAULT_FADE_MS if fade_in_ms is None else int(fade_in_ms)
+        if cues and cues[-1][0] == music_file and cues[-1][2] == volume:
+            continue
+        cues.append((music_file, start_ms, volume, fade_in_ms))
+
+    segments = []
+    for i, (music_file, start_ms, volume, fade_in_ms) in enumerate(cues):
+        if i + 1 < len(cues):
+            next_start_ms, crossfade_ms = cues[i + 1][1], cues[i + 1][3]
+            end_ms = min(next_start_ms + crossfade_ms, total_ms)
+            fade_out_ms = min(crossfade_ms, end_ms - next_start_ms)
+        else:
+            end_ms = total_ms
+            fade_out_ms = MUSIC_DEFAULT_FADE_MS
+        length_ms = end_ms - start_ms
+        if length_ms <= 0:
+            continue
+        segments.append(_MusicSegment(
+            music_file=music_file,
+            start_ms=start_ms,
+            length_ms=length_ms,
+            volume=volume,
+            fade_in_ms=min(fade_in_ms, length_ms),
+            fade_out_ms=min(fade_out_ms, length_ms),
+        ))
+    return segments
+
+
+def _segment_filter(segment: _MusicSegment) -> str:
+    """Trim a looped bed to the segment and apply its fades (0 ms = hard cut)."""
+    length_s = segment.length_ms / 1000
+    chain = [f"atrim=duration={length_s}"]
+    if segment.fade_in_ms > 0:
+        chain.append(f"afade=t=in:d={segment.fade_in_ms / 1000}")
+    if segment.fade_out_ms > 0:
+        fade_out_s = segment.fade_out_ms / 1000
+        chain.append(f"afade=t=out:st={max(length_s - fade_out_s, 0)}:d={fade_out_s}")
+    return ",".join(chain)
+
+
+async def _get_music_bed(music_file: Path, length_ms: int, cache_dir: Path) -> Path:
+    """Return a cached loop of the track at least length_ms long.
+
+    Lengths are rounded up to MUSIC_BED_GRID_S. The source file's size and
+    mtime are part of the name, so replacing a track invalidates its beds.
+    Safe with concurrent renders: each render writes to its own temp file
+    and renames it into place, and nothing is deleted here. Superseded
+    beds are removed by prune_music_cache.
+    """
+    prefix = _music_bed_prefix(music_file)
+
+    for bed in cache_dir.glob(f"{glob.escape(prefix)}*s.flac"):
+        try:
+            bed_s = int(bed.stem[len(prefix):-1])
+        except ValueError:
+            continue
+        if bed_s * 1000 >= length_ms:
+            logger.debug(f"Music bed cache hit: {bed.name}")
+            return bed
+
+    bed_s = -(-length_ms // (MUSIC_BED_GRID_S * 1000)) * MUSIC_BED_GRID_S
+    bed_path = cache_dir / f"{prefix}{bed_s}s.flac"
+    logger.info(f"Rendering {bed_s}s music bed for {music_file.name}")
+
+    # Unique temp name per render, renamed into place once complete
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=f".{prefix}", suffix=".partial")
+    os.close(fd)
+    try:
+        await _run_ffmpeg([
+            "-stream_loop", "-1",
+            "-i", str(music_file),
+            "-t", str(bed_s),
+            "-c:a", "flac",
+            "-f", "flac",
+            tmp_name,
+        ])
+        os.replace(tmp_name, bed_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return bed_path
+
+
+def _music_bed_prefix(music_file: Path) -> str:
+    """Bed name prefix: {stem}_{track key}_{version key}_ (length follows)."""
+    stat = music_file.stat()
+    track_key = hashlib.sha1(str(music_file.resolve()).encode()).hexdigest()[:8]
+    version_key = hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:8]
+    return f"{music_file.stem}_{track_key}_{version_key}_"
+
+
+def prune_music_cache(cache_dir: Path | None = None) -> int:
+    """Remove superseded music beds and abandoned partial renders.
+
+    For each track, only the longest bed of its newest version is kept;
+    beds of replaced track versions and shorter beds are deleted. Run it
+    while no renders are active, since a render may be about to read a
+    bed this removes. Returns the number of bytes freed.
+    """
+    cache_dir = cache_dir or MUSIC_CACHE_DIR
+    if not cache_dir.is_dir():
+        return 0
+
+    freed = 0
+    by_track: dict[tuple[str, str], list[tuple[Path, str, int]]] = {}
+    for path in cache_dir.iterdir():
+        if path.suffix == ".partial":
+            freed += path.stat().st_size
+            path.unlink()
+            continue
+        parts = path.stem.rsplit("_", 3)
+        if path.suffix != ".flac" or len(parts) != 4 or not parts[3].endswith("s"):
+            continue
+        try:
+            bed_s = int(parts[3][:-1])
+        except ValueError:
+            continue
+        by_track.setdefault((parts[0], parts[1]), []).append((path, parts[2], bed_s))
+
+    for beds in by_track.values():
+        newest = max(beds, key=lambda b: b[0].stat().st_mtime)[1]
+        keep = max((b for b in beds if b[1] == newest), key=lambda b: b[2])[0]
+        for path, _, _ in beds:
+            if path != keep:
+                freed += path.stat().st_size
+                path.unlink()
+
+    logger.info(f"Music cache pruned: {freed / 1024 / 1024:.1f} MB freed")
+    return freed
+
+
 async def build_sfx_track(
     sfx_cues: list[dict],
     assets_dir: Path,
@@ -94,38 +349,127 @@ async def build_sfx_track(
         await _create_silence(output_path, total_duration_s)
         return output_path
 
-    inputs = []
-    filters = []
-    valid_count = 0
-
+    clips = []
     for cue in sfx_cues:
         sfx_file = assets_dir / "audio" / "sfx" / f"{cue['clip']}.wav"
         if not sfx_file.exists():
             logger.warning(f"SFX not found: {sfx_file}")
             continue
 
-        delay = int(cue["wall_clock_ms"])
-        volume = cue.get("volume", 1.0)
-        inputs.extend(["-i", str(sfx_file)])
-        filters.append(f"[{valid_count}]adelay={delay}|{delay},volume={volume}[s{valid_count}]")
-        valid_count += 1
+        clips.append(_Clip(
+            path=sfx_file,
+            delay_ms=int(cue["wall_clock_ms"]),
+            volume=cue.get("volume", 1.0),
+        ))
 
-    if valid_count == 0:
+    if not clips:
         await _create_silence(output_path, total_duration_s)
         return output_path
 
-    mix_inputs = "".join(f"[s{i}]" for i in range(valid_count))
-    filters.append(f"{mix_inputs}amix=inputs={valid_count}:normalize=0[sfx]")
+    await _mix_clips(clips, output_path)
+    return output_path
+
+
+@dataclass
+class _Clip:
+    path: Path
+    delay_ms: int
+    volume: float = 1.0
+    pre_filter: str = ""
+
+
+async def _mix_clips(clips: list[_Clip], output_path: Path) -> None:
+    """Mix positioned clips as a tree of bounded, time-windowed submixes.
+
+    Clips are sorted by start time and grouped into windows of at most
+    MIX_CHUNK_SIZE. Each window is rendered to an intermediate WAV whose
+    timeline starts at the window's first clip, and the resulting
+    submixes become the clips of the next level until one ffmpeg job can
+    take them all. At most MIX_MAX_PARALLEL jobs run at once, so open
+    files and ffmpeg memory stay bounded however many clips there are,
+    and each level's intermediates are deleted once the next level is done.
+    """
+    work_dir = output_path.parent / f".{output_path.stem}_submixes"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(MIX_MAX_PARALLEL)
+    clips = sorted(clips, key=lambda c: c.delay_ms)
+    level = 0
+
+    try:
+        while len(clips) > MIX_CHUNK_SIZE:
+            chunks = [
+                clips[i:i + MIX_CHUNK_SIZE]
+                for i in range(0, len(clips), MIX_CHUNK_SIZE)
+            ]
+            logger.debug(f"Mix level {level}: {len(clips)} clips -> {len(chunks)} submixes")
+            submixes = await _gather_or_cancel(*(
+                _render_submix(chunk, work_dir / f"l{level}_{j:05d}.wav", semaphore)
+                for j, chunk in enumerate(chunks)
+            ))
+            for clip in clips:
+                if clip.path.parent == work_dir:
+                    clip.path.unlink(missing_ok=True)
+            clips = submixes
+            level += 1
 
-    cmd = [
+        await _run_ffmpeg(_mix_args(clips, 0, output_path, ["-c:a", "aac"]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+async def _render_submix(
+    chunk: list[_Clip],
+    output_path: Path,
+    semaphore: asyncio.Semaphore,
+) -> _Clip:
+    """Render one window of clips and return it as a clip for the next level.
+
+    A failed window is retried once so a transient ffmpeg error does not
+    throw away the rest of the tree.
+    """
+    base_ms = chunk[0].delay_ms
+    args = _mix_args(chunk, base_ms, output_path, ["-c:a", "pcm_s16le"])
+    async with semaphore:
+        try:
+            await _run_ffmpeg(args)
+        except RuntimeError as e:
+            logger.warning(f"Submix {output_path.name} failed, retrying: {e}")
+            await _run_ffmpeg(args)
+    return _Clip(path=output_path, delay_ms=base_ms)
+
+
+def _mix_args(
+    clips: list[_Clip],
+    base_ms: int,
+    output_path: Path | str,
+    codec_args: list[str],
+    post_filter: str = "",
+) -> list[str]:
+    """ffmpeg args placing each clip at its delay relative to base_ms.
+
+    post_filter is appended to the amix filter chain (leading comma included).
+    """
+    inputs = []
+    filters = []
+    for i, clip in enumerate(clips):
+        delay = clip.delay_ms - base_ms
+        chain = f"{clip.pre_filter}," if clip.pre_filter else ""
+        chain += f"adelay={delay}|{delay}"
+        if clip.volume != 1.0:
+            chain += f",volume={clip.volume}"
+        inputs.extend(["-i", str(clip.path)])
+        filters.append(f"[{i}]{chain}[c{i}]")
+
+    mix_inputs = "".join(f"[c{i}]" for i in range(len(clips)))
+    filters.append(f"{mix_inputs}amix=inputs={len(clips)}:normalize=0{post_filter}[mix]")
+
+    return [
         *inputs,
         "-filter_complex", ";".join(filters),
-        "-map", "[sfx]",
-        "-c:a", "aac",
+        "-map", "[mix]",
+        *codec_args,
         str(output_path),
     ]
-    await _run_ffmpeg(cmd)
-    return output_path
 
 
 async def mix_all_layers(
@@ -157,6 +501,45 @@ async def _create_silence(output_path: Path, duration_s: float) -> None:
     ])
 
 
+async def _gather_or_cancel(*coros) -> list:
+    """Like asyncio.gather, but cancel and await the rest if one job fails.
+
+    (asyncio.TaskGroup does this but needs Python 3.11; we support 3.10.)
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _pipe_ffmpeg(args: list[str], sink: asyncio.StreamWriter) -> None:
+    """Run ffmpeg writing to pipe:1 and copy its output into sink."""
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-y", "-nostats", *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    try:
+        while chunk := await proc.stdout.read(1 << 16):
+            sink.write(chunk)
+            await sink.drain()
+        await proc.wait()
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        stderr_task.cancel()
+        raise
+    stderr = await stderr_task
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {stderr.decode()[-500:]}")
+
+
 async def _run_ffmpeg(args: list[str]) -> None:
     """Run ffmpeg safely using argument list (no shell invocation)."""
     full_args = ["ffmpeg", "-y", *args]
@@ -166,6 +549,12 @@ async def _run_ffmpeg(args: list[str]) -> None:
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
-    _, stderr = await proc.communicate()
+    try:
+        _, stderr = await proc.communicate()
+    except asyncio.CancelledError:
+        # Don't leave ffmpeg writing into a directory that is being removed
+        proc.kill()
+        await proc.wait()
+        raise
     if proc.returncode != 0:
         raise RuntimeError(f"ffmpeg failed: {stderr.decode()[-500:]}")
@@ -34,17 +34,24 @@ def main(ctx: click.Context, verbose: bool) -> None:
 @main.command()
 @click.argument("script_path", type=click.Path(exists=True))
 @click.option("--output", "-o", type=click.Path(), default="./output", help="Output directory.")
+@click.option(
+    "--stream", is_flag=True,
+    help=(
+        "Stream narrations and the narration mix for long compilations, "
+        "deleting intermediates early; reports peak RSS, temp disk and "
+        "music cache growth."
+    ),
+)
 @click.pass_context
-def render(ctx: click.Context, script_path: str, output: str) -> None:
+def render(ctx: click.Context, script_path: str, output: str, stream: bool) -> None:
     """Render an episode from a JSON script."""
     from .script_parser import load_episode
     from .narration import generate_all_narrations
-    from .recorder import record_episode
-    from .audio_mixer import (
-        build_narration_track, build_music_track,
-        build_sfx_track, mix_all_layers,
+    from .audio_mixer import build_narration_track
+    from .phases import (
+        assemble_episode, episode_duration_s, mix_layers,
+        print_narration_summary, print_phase, record_playback,
     )
-    from .assembler import assemble_video
 
     script = load_episode(script_path)
 
@@ -56,6 +63,12 @@ def render(ctx: click.Context, script_path: str, output: str) -> None:
     output_dir = Path(output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    if stream:
+        from .streaming import render_streaming
+
+        asyncio.run(render_streaming(script, Path(script_path), output_dir, console))
+        return
+
     async def _run() -> None:
         with tempfile.TemporaryDirectory(prefix="ramayana_") as tmp:
             tmp_path = Path(tmp)
@@ -65,7 +78,7 @@ def render(ctx: click.Context, script_path: str, output: str) -> None:
             video_dir.mkdir()
 
             # Phase 1: Generate narrations
-            console.print("\n[bold cyan]Phase 1:[/bold cyan] Generating narrations...")
+            print_phase(console, 1, "Generating narrations")
             texts = script.all_narration_texts()
             narrations = await generate_all_narrations(
                 texts=texts,
@@ -74,21 +87,15 @@ def render(ctx: click.Context, script_path: str, output: str) -> None:
                 rate=script.episode.narration.rate,
             )
             durations = [n.duration_ms for n in narrations]
-            total_audio = sum(durations)
-            narrated = sum(1 for d in durations if d > 0)
-            console.print(f"  {narrated}/{len(durations)} beats narrated, total: {total_audio / 1000:.1f}s")
+            print_narration_summary(console, durations)
 
             # Phase 2: Record browser
-            console.print("\n[bold cyan]Phase 2:[/bold cyan] Recording scene playback...")
-            recording = await record_episode(
-                script_path=Path(script_path),
-                beat_durations=durations,
-                video_dir=video_dir,
-                resolution=script.episode.resolution.model_dump(),
+            recording = await record_playback(
+                console, script, Path(script_path), durations, video_dir
             )
 
             # Phase 3: Build audio layers
-            console.print("\n[bold cyan]Phase 3:[/bold cyan] Mixing audio layers...")
+            print_phase(console, 3, "Mixing audio layers")
             narration_timestamps = [
                 cue["wall_clock_ms"]
                 for cue in recording.audio_cue_log
@@ -98,21 +105,14 @@ def render(ctx: click.Context, script_path: str, output: str) -> None:
             sfx_cues = [c for c in recording.audio_cue_log if c["type"] == "sfx"]
 
             last_ts = narration_timestamps[-1] if narration_timestamps else 0
-            last_dur = durations[-1] if durations else 0
-            total_duration_s = max((last_ts + last_dur) / 1000 + 2, 10)
+            total_duration_s = episode_duration_s(last_ts, durations)
 
             narration_track = await build_narration_track(
                 narrations, narration_timestamps, tmp_path / "narration.aac"
             )
-            project_root = Path(script_path).parent.parent
-            music_track = await build_music_track(
-                music_cues, project_root, total_duration_s, tmp_path / "music.aac"
-            )
-            sfx_track = await build_sfx_track(
-                sfx_cues, project_root, total_duration_s, tmp_path / "sfx.aac"
-            )
-            mixed_audio = await mix_all_layers(
-                narration_track, music_track, sfx_track, tmp_path / "mixed.aac"
+            mixed_audio = await mix_layers(
+                narration_track, music_cues, sfx_cues,
+                Path(script_path), total_duration_s, tmp_path,
             )
 
             # Build combined SRT
@@ -121,29 +121,29 @@ def render(ctx: click.Context, script_path: str, output: str) -> None:
             srt_output.write_text("\n\n".join(srt_parts), encoding="utf-8")
 
             # Phase 4: Assemble final video
-            console.print("\n[bold cyan]Phase 4:[/bold cyan] Assembling final video...")
-            mp4_output = output_dir / f"{script.episode.id}.mp4"
-            await assemble_video(
-                video_path=recording.video_path,
-                audio_path=mixed_audio,
-                srt_path=srt_output,
-                output_path=mp4_output,
+            await assemble_episode(
+                console, script, recording.video_path, mixed_audio, srt_output, output_dir
             )
 
-            console.print("\n[bold green]Episode rendered![/bold green]")
-            console.print(f"  MP4: {mp4_output}")
-            console.print(f"  SRT: {srt_output}")
-
     asyncio.run(_run())
 
 
 @main.command()
 @click.argument("script_path", type=click.Path(exists=True))
 def preview(script_path: str) -> None:
-    """Open the renderer in a browser for live preview (no recording)."""
+    """Open the renderer in a browser and hot-reload on script edits (no recording)."""
+    from .phases import assets_root
+    from .preview import run_preview
+
     console.print("[bold]Starting preview server...[/bold]")
     console.print(f"Script: {script_path}")
-    console.print("[dim]Run 'npm run dev' in the project root to start the Vite dev server.[/dim]")
+    console.print("[dim]Edits to the script replay from the changed scene. Ctrl+C to stop.[/dim]")
+
+    project_root = assets_root(Path(script_path))
+    try:
+        asyncio.run(run_preview(Path(script_path), project_root))
+    except KeyboardInterrupt:
+        console.print("\n[bold]Preview stopped.[/bold]")
 
 
 @main.command()
@@ -171,5 +171,15 @@ def voices(language: str) -> None:
     console.print(f"\n[dim]Total: {len(voice_list)} voices[/dim]")
 
 
+@main.command("prune-cache")
+def prune_cache() -> None:
+    """Delete superseded music beds. Run while no renders are active."""
+    from .audio_mixer import MUSIC_CACHE_DIR, prune_music_cache
+
+    freed = prune_music_cache()
+    console.print(f"[bold]Music cache:[/bold] {MUSIC_CACHE_DIR}")
+    console.print(f"  Freed {freed / 1024 / 1024:.1f} MB")
+
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,9 @@
 """Edge TTS narration generation — adapted from demo-recorder."""
 
 import asyncio
+import hashlib
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -9,6 +11,9 @@ import edge_tts
 
 logger = logging.getLogger("ramayana-engine")
 
+# Concurrent Edge TTS connections; more than a few gets throttled
+TTS_MAX_PARALLEL = 4
+
 
 @dataclass
 class NarrationResult:
@@ -58,12 +63,64 @@ async def generate_all_narrations(
     """Generate TTS for all beat narrations."""
     results = []
     for i, text in enumerate(texts):
-        audio_path = output_dir / f"beat_{i:03d}.mp3"
+        audio_path = beat_audio_path(output_dir, i)
         result = await generate_narration(text, audio_path, voice, rate)
         results.append(result)
     return results
 
 
+async def iter_narrations(
+    texts: list[str],
+    output_dir: Path,
+    voice: str = "en-US-GuyNeural",
+    rate: str = "+0%",
+) -> AsyncIterator[NarrationResult]:
+    """Yield beat narrations one at a time so callers need not hold them all.
+
+    Audio lands at beat_audio_path(output_dir, i), as in generate_all_narrations.
+    """
+    for i, text in enumerate(texts):
+        audio_path = beat_audio_path(output_dir, i)
+        yield await generate_narration(text, audio_path, voice, rate)
+
+
+def beat_audio_path(output_dir: Path, beat_index: int) -> Path:
+    """Where the narration audio for a beat is written."""
+    return output_dir / f"beat_{beat_index:03d}.mp3"
+
+
+async def generate_narrations_incremental(
+    texts: list[str],
+    output_dir: Path,
+    cache: dict[tuple[str, str, str], NarrationResult],
+    voice: str = "en-US-GuyNeural",
+    rate: str = "+0%",
+) -> list[NarrationResult]:
+    """Generate TTS for all beat narrations, reusing earlier results.
+
+    Results are cached by (text, voice, rate), so only new or edited
+    lines are synthesized. Missing lines are generated at most
+    TTS_MAX_PARALLEL at a time, and each result is cached as soon as it
+    completes so a failed call does not discard the others.
+    """
+    missing = {(text, voice, rate) for text in texts} - cache.keys()
+    semaphore = asyncio.Semaphore(TTS_MAX_PARALLEL)
+
+    async def synthesize(key: tuple[str, str, str]) -> None:
+        async with semaphore:
+            audio_path = output_dir / f"line_{_cache_digest(key)}.mp3"
+            cache[key] = await generate_narration(key[0], audio_path, voice, rate)
+
+    if missing:
+        await asyncio.gather(*(synthesize(key) for key in missing))
+        logger.debug(f"Narration: {len(missing)} lines synthesized, {len(texts) - len(missing)} reused")
+    return [cache[(text, voice, rate)] for text in texts]
+
+
+def _cache_digest(key: tuple[str, ...]) -> str:
+    return hashlib.sha1("\0".join(key).encode("utf-8")).hexdigest()[:16]
+
+
 async def _measure_duration(audio_path: Path) -> int:
     """Get audio duration in ms using ffprobe.
 
@@ -0,0 +1,102 @@
+"""Render steps shared by `render` and its streaming mode (streaming.py)."""
+
+from pathlib import Path
+
+from rich.console import Console
+
+from .assembler import assemble_video
+from .audio_mixer import build_music_track, build_sfx_track, mix_all_layers
+from .models import EpisodeScript
+from .recorder import RecordingResult, record_episode
+
+
+def print_phase(console: Console, number: int, label: str) -> None:
+    console.print(f"\n[bold cyan]Phase {number}:[/bold cyan] {label}...")
+
+
+def print_narration_summary(console: Console, durations: list[int]) -> None:
+    narrated = sum(1 for d in durations if d > 0)
+    console.print(f"  {narrated}/{len(durations)} beats narrated, total: {sum(durations) / 1000:.1f}s")
+
+
+def episode_duration_s(last_narration_ms: float, durations: list[int]) -> float:
+    """Track length: last narration mark plus the last beat, 2s tail, 10s minimum."""
+    last_dur = durations[-1] if durations else 0
+    return max((last_narration_ms + last_dur) / 1000 + 2, 10)
+
+
+def assets_root(script_path: Path) -> Path:
+    """Project root holding audio/ assets (episodes live one level down)."""
+    return script_path.parent.parent
+
+
+async def record_playback(
+    console: Console,
+    script: EpisodeScript,
+    script_path: Path,
+    durations: list[int],
+    video_dir: Path,
+    cue_log_path: Path | None = None,
+) -> RecordingResult:
+    """Phase 2: record the renderer playing the episode."""
+    print_phase(console, 2, "Recording scene playback")
+    return await record_episode(
+        script_path=script_path,
+        beat_durations=durations,
+        video_dir=video_dir,
+        resolution=script.episode.resolution.model_dump(),
+        cue_log_path=cue_log_path,
+    )
+
+
+async def mix_layers(
+    narration_track: Path,
+    music_cues: list[dict],
+    sfx_cues: list[dict],
+    script_path: Path,
+    total_duration_s: float,
+    work_dir: Path,
+    delete_stems: bool = False,
+) -> Path:
+    """Build the music and SFX layers and mix them with the narration track.
+
+    With delete_stems, the three layer tracks are removed once mixed.
+    """
+    root = assets_root(script_path)
+    music_track = await build_music_track(
+        music_cues, root, total_duration_s, work_dir / "music.aac"
+    )
+    sfx_track = await build_sfx_track(
+        sfx_cues, root, total_duration_s, work_dir / "sfx.aac"
+    )
+    mixed_audio = await mix_all_layers(
+        narration_track, music_track, sfx_track, work_dir / "mixed.aac"
+    )
+    if delete_stems:
+        for stem in (narration_track, music_track, sfx_track):
+            stem.unlink()
+    return mixed_audio
+
+
+async def assemble_episode(
+    console: Console,
+    script: EpisodeScript,
+    video_path: Path,
+    audio_path: Path,
+    srt_path: Path,
+    output_dir: Path,
+) -> Path:
+    """Phase 4: assemble the final MP4 and print where the outputs are."""
+    print_phase(console, 4, "Assembling final video")
+    mp4_output = output_dir / f"{script.episode.id}.mp4"
+    await assemble_video(
+        video_path=video_path,
+        audio_path=audio_path,
+        srt_path=srt_path,
+        output_path=mp4_output,
+    )
+
+    console.print("\n[bold green]Episode rendered![/bold green]")
+    console.print(f"  MP4: {mp4_output}")
+    console.print(f"  SRT: {srt_path}")
+    return mp4_output
@@ -0,0 +1,182 @@
+"""Live preview — Vite renderer + episode watcher with incremental narration.
+
+The Vite dev server is spawned with asyncio.create_subprocess_exec
+(argument list, no shell), matching the ffmpeg helpers.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page, async_playwright
+
+from .models import EpisodeScript
+from .narration import NarrationResult, generate_narrations_incremental
+from .recorder import RENDERER_URL
+from .script_parser import changed_scene_indices, load_episode, revalidate_episode
+
+logger = logging.getLogger("ramayana-engine")
+
+POLL_INTERVAL_S = 0.3
+SERVER_STARTUP_TIMEOUT_S = 30
+
+
+class PreviewSession:
+    """State carried between reloads: last raw script, models and narrations."""
+
+    def __init__(self, script_path: Path, page: Page, audio_dir: Path) -> None:
+        self.script_path = script_path
+        self.page = page
+        self.audio_dir = audio_dir
+        self.raw: dict = json.loads(script_path.read_text(encoding="utf-8"))
+        self.script: EpisodeScript = load_episode(script_path)
+        self.narrations: dict[tuple[str, str, str], NarrationResult] = {}
+
+    async def start(self) -> None:
+        """Synthesize every line, hand the script to the page and play it."""
+        await self._push(self.raw, self.script, start_scene=0)
+
+    async def reload(self) -> None:
+        """Re-validate and re-narrate only what changed, then jump to it.
+
+        Any failure is logged and the previous script stays current, so a
+        bad save or a TTS hiccup never ends the preview.
+        """
+        started = time.monotonic()
+        try:
+            raw = json.loads(self.script_path.read_text(encoding="utf-8"))
+            changed = changed_scene_indices(self.raw, raw)
+            script = revalidate_episode(raw, self.script, changed)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # ValueError covers JSONDecodeError and pydantic's ValidationError
+            logger.error(f"Script not reloaded: {e}")
+            return
+
+        if changed:
+            start_scene = changed[0]
+        else:
+            start_scene = _first_moved_scene(self.raw, raw)
+            if start_scene is None:
+                logger.info("Script saved without scene changes")
+                return
+
+        try:
+            await self._push(raw, script, start_scene)
+        except Exception as e:
+            logger.error(f"Preview not updated: {e}")
+            return
+
+        self.raw, self.script = raw, script
+        logger.info(
+            f"Reloaded {len(changed)} scene(s), playing from scene {start_scene} "
+            f"({time.monotonic() - started:.1f}s)"
+        )
+
+    async def _push(self, raw: dict, script: EpisodeScript, start_scene: int) -> None:
+        narration = script.episode.narration
+        results = await generate_narrations_incremental(
+            texts=script.all_narration_texts(),
+            output_dir=self.audio_dir,
+            cache=self.narrations,
+            voice=narration.voice,
+            rate=narration.rate,
+        )
+        durations = [r.duration_ms for r in results]
+
+        await self.page.evaluate("(data) => window.loadEpisode(data)", raw)
+        await self.page.evaluate("(d) => window.setBeatDurations(d)", durations)
+        # Fire and forget: playback runs until the next edit or the end
+        await self.page.evaluate("(i) => { window.playFromScene(i); }", start_scene)
+
+
+async def run_preview(script_path: Path, project_root: Path) -> None:
+    """Serve the renderer, open it in a browser and hot-reload on script edits."""
+    server = await _ensure_dev_server(project_root)
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=False)
+            page = await browser.new_page(viewport={"width": 1280, "height": 720})
+            await page.goto(f"{RENDERER_URL}?script={script_path}", wait_until="load")
+            await page.wait_for_function(
+                "typeof window.playFromScene === 'function'",
+                timeout=30000,
+            )
+
+            with tempfile.TemporaryDirectory(prefix="ramayana_preview_") as tmp:
+                session = PreviewSession(script_path, page, Path(tmp))
+                await session.start()
+                logger.info(f"Watching {script_path} for changes (Ctrl+C to stop)")
+                await _watch(session)
+
+            await browser.close()
+    finally:
+        if server is not None:
+            server.terminate()
+            await server.wait()
+
+
+async def _watch(session: PreviewSession) -> None:
+    """Poll the script's mtime and reload on change until the page closes."""
+    last_mtime = session.script_path.stat().st_mtime_ns
+    while not session.page.is_closed():
+        await asyncio.sleep(POLL_INTERVAL_S)
+        try:
+            mtime = session.script_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue  # editors may replace the file on save
+        if mtime != last_mtime:
+            last_mtime = mtime
+            await session.reload()
+
+
+async def _ensure_dev_server(project_root: Path) -> asyncio.subprocess.Process | None:
+    """Start the Vite dev server unless one is already listening."""
+    url = urlsplit(RENDERER_URL)
+    if await _is_listening(url.hostname, url.port):
+        logger.info(f"Using running renderer at {RENDERER_URL}")
+        return None
+
+    logger.info(f"Starting Vite dev server at {RENDERER_URL}...")
+    proc = await asyncio.create_subprocess_exec(
+        "npx", "vite",
+        cwd=str(project_root),
+        env={**os.environ, "RAMAYANA_PREVIEW": "1"},
+        stdout=asyncio.subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT_S
+    while not await _is_listening(url.hostname, url.port):
+        if proc.returncode is not None:
+            raise RuntimeError(f"Vite dev server exited with code {proc.returncode}")
+        if time.monotonic() > deadline:
+            proc.terminate()
+            raise RuntimeError("Timed out waiting for the Vite dev server")
+        await asyncio.sleep(POLL_INTERVAL_S)
+    return proc
+
+
+async def _is_listening(host: str, port: int) -> bool:
+    try:
+        _, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        return False
+    writer.close()
+    await writer.wait_closed()
+    return True
+
+
+def _first_moved_scene(old_raw: dict, new_raw: dict) -> int | None:
+    """First index whose scene id differs (scenes removed or reordered)."""
+    old_ids = [s.get("id") for s in old_raw.get("scenes", [])]
+    new_ids = [s.get("id") for s in new_raw.get("scenes", [])]
+    if old_ids == new_ids:
+        return None
+    for i, (old_id, new_id) in enumerate(zip(old_ids, new_ids)):
+        if old_id != new_id:
+            return i
+    return max(min(len(old_ids), len(new_ids)) - 1, 0)
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -10,12 +11,14 @@ from playwright.async_api import async_playwright
 logger = logging.getLogger("ramayana-engine")
 
 RENDERER_URL = "http://localhost:3000"
+CUE_LOG_PAGE_SIZE = 500
 
 
 @dataclass
 class RecordingResult:
     video_path: Path
     audio_cue_log: list[dict]
+    cue_log_path: Path | None = None
 
 
 async def record_episode(
@@ -23,6 +26,7 @@ async def record_episode(
     beat_durations: list[int],
     video_dir: Path,
     resolution: dict | None = None,
+    cue_log_path: Path | None = None,
 ) -> RecordingResult:
     """Record the PixiJS renderer playing an episode.
 
@@ -31,6 +35,10 @@ async def record_episode(
     3. Send beat durations
     4. Start playback and wait for completion
     5. Collect audio cue log
+
+    With cue_log_path, the cue log is fetched in pages and written there
+    as JSON lines (read back with iter_cue_log) instead of being returned
+    as one list.
     """
     width = resolution.get("width", 1920) if resolution else 1920
     height = resolution.get("height", 1080) if resolution else 1080
@@ -70,7 +78,11 @@ async def record_episode(
         )
 
         # Collect audio cue log
-        cue_log = await page.evaluate("window.getAudioCueLog()")
+        if cue_log_path is not None:
+            cue_log = []
+            await _write_cue_log(page, cue_log_path)
+        else:
+            cue_log = await page.evaluate("window.getAudioCueLog()")
 
         await page.close()
         await context.close()
@@ -85,4 +97,33 @@ async def record_episode(
     file_size_mb = video_path.stat().st_size / 1024 / 1024
     logger.info(f"Recorded video: {video_path} ({file_size_mb:.1f} MB)")
 
-    return RecordingResult(video_path=video_path, audio_cue_log=cue_log)
+    return RecordingResult(
+        video_path=video_path,
+        audio_cue_log=cue_log,
+        cue_log_path=cue_log_path,
+    )
+
+
+def iter_cue_log(cue_log_path: Path) -> Iterator[dict]:
+    """Stream cues back from a JSON-lines cue log written by record_episode."""
+    with open(cue_log_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+async def _write_cue_log(page, cue_log_path: Path) -> None:
+    """Page the browser's cue log into a JSON-lines file."""
+    start = 0
+    with open(cue_log_path, "w", encoding="utf-8") as f:
+        while True:
+            page_cues = await page.evaluate(
+                "([start, end]) => window.getAudioCueLogSlice(start, end)",
+                [start, start + CUE_LOG_PAGE_SIZE],
+            )
+            for cue in page_cues:
+                f.write(json.dumps(cue) + "\n")
+            if len(page_cues) < CUE_LOG_PAGE_SIZE:
+                break
+            start += CUE_LOG_PAGE_SIZE
+    logger.info(f"Cue log written: {cue_log_path} ({start + len(page_cues)} cues)")
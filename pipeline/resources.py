@@ -0,0 +1,95 @@
+"""Peak memory and temp-disk tracking, for sizing render workers."""
+
+import asyncio
+import os
+import resource
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class ResourceReport:
+    peak_rss_mb: float
+    peak_child_rss_mb: float
+    peak_temp_disk_mb: float
+    cache_growth_mb: float = 0.0
+
+
+class ResourceMonitor:
+    """Sample the size of a temp dir in the background and record its peak.
+
+    If cache_dir is given, its growth over the run is tracked too. That
+    covers persistent files such as music beds, which outlive the temp
+    dir but still need disk on the worker. Other processes writing to
+    the same cache are counted as well.
+
+    Use as an async context manager around the work; report() also reads
+    the process's peak RSS and that of its largest reaped child process
+    (ffmpeg, ffprobe or the Playwright driver).
+    """
+
+    def __init__(
+        self,
+        temp_dir: Path,
+        cache_dir: Path | None = None,
+        interval_s: float = 0.5,
+    ) -> None:
+        self.temp_dir = temp_dir
+        self.cache_dir = cache_dir
+        self.interval_s = interval_s
+        self.peak_disk_bytes = 0
+        self.initial_cache_bytes = self.peak_cache_bytes = self._cache_size()
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "ResourceMonitor":
+        self.sample()
+        self._task = asyncio.create_task(self._poll())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.sample()
+
+    def sample(self) -> None:
+        """Measure the temp and cache dirs now; call after stages that write large files."""
+        self.peak_disk_bytes = max(self.peak_disk_bytes, _dir_size(self.temp_dir))
+        self.peak_cache_bytes = max(self.peak_cache_bytes, self._cache_size())
+
+    def report(self) -> ResourceReport:
+        return ResourceReport(
+            peak_rss_mb=_maxrss_mb(resource.RUSAGE_SELF),
+            peak_child_rss_mb=_maxrss_mb(resource.RUSAGE_CHILDREN),
+            peak_temp_disk_mb=self.peak_disk_bytes / 1024 / 1024,
+            cache_growth_mb=(self.peak_cache_bytes - self.initial_cache_bytes) / 1024 / 1024,
+        )
+
+    def _cache_size(self) -> int:
+        return _dir_size(self.cache_dir) if self.cache_dir is not None else 0
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            self.sample()
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except FileNotFoundError:
+                pass  # deleted between listing and stat
+    return total
+
+
+def _maxrss_mb(who: int) -> float:
+    """ru_maxrss is in bytes on macOS and kilobytes elsewhere."""
+    maxrss = resource.getrusage(who).ru_maxrss
+    return maxrss / 1024 / 1024 if sys.platform == "darwin" else maxrss / 1024
@@ -4,7 +4,7 @@ import json
 import logging
 from pathlib import Path
 
-from .models import EpisodeScript
+from .models import EpisodeMeta, EpisodeScript, Scene
 
 logger = logging.getLogger("ramayana-engine")
 
@@ -31,3 +31,60 @@ def load_episode(path: str | Path) -> EpisodeScript:
     )
 
     return script
+
+
+def changed_scene_indices(old_raw: dict, new_raw: dict) -> list[int]:
+    """Indices of scenes in new_raw that differ from the same-id scene in old_raw.
+
+    Scenes are matched by (id, occurrence), so reordering alone does not
+    count as a change and repeated ids are not conflated. A changed
+    episode or assets block marks every scene changed.
+    """
+    new_scenes = new_raw.get("scenes", [])
+    if (old_raw.get("episode"), old_raw.get("assets")) != (new_raw.get("episode"), new_raw.get("assets")):
+        return list(range(len(new_scenes)))
+
+    old_scenes = old_raw.get("scenes", [])
+    old_by_key = dict(zip(_scene_keys(s.get("id") for s in old_scenes), old_scenes))
+    new_keys = _scene_keys(s.get("id") for s in new_scenes)
+    return [
+        i for i, (key, scene) in enumerate(zip(new_keys, new_scenes))
+        if old_by_key.get(key) != scene
+    ]
+
+
+def revalidate_episode(
+    raw: dict,
+    previous: EpisodeScript,
+    changed: list[int],
+) -> EpisodeScript:
+    """Validate an edited script, re-parsing only the changed scenes.
+
+    Unchanged scenes reuse the already-validated models from previous,
+    matched by (id, occurrence) as in changed_scene_indices.
+    """
+    raw_scenes = raw.get("scenes", [])
+    previous_by_key = dict(zip(_scene_keys(s.id for s in previous.scenes), previous.scenes))
+    keys = _scene_keys(s.get("id") for s in raw_scenes)
+    scenes = [
+        Scene.model_validate(raw_scene)
+        if i in changed or key not in previous_by_key
+        else previous_by_key[key]
+        for i, (key, raw_scene) in enumerate(zip(keys, raw_scenes))
+    ]
+
+    return EpisodeScript(
+        episode=EpisodeMeta.model_validate(raw["episode"]),
+        assets=raw.get("assets", {}),
+        scenes=scenes,
+    )
+
+
+def _scene_keys(ids) -> list[tuple]:
+    """Pair each scene id with its occurrence count, since ids may repeat."""
+    seen: dict = {}
+    keys = []
+    for scene_id in ids:
+        keys.append((scene_id, seen.get(scene_id, 0)))
+        seen[scene_id] = seen.get(scene_id, 0) + 1
+    return keys
@@ -0,0 +1,123 @@
+"""Streaming render for long compilations.
+
+Same phases as `render`, but with less held in memory and on disk:
+
+- narrations are consumed one at a time, keeping only durations, with
+  SRT text appended straight to the output file;
+- the cue log is paged out of the browser into a JSON-lines file, and
+  narration marks are streamed from it into the narration mix;
+- the narration track is mixed window by window into one streaming
+  encoder, deleting each window's beat MP3s once encoded;
+- the cue log and layer tracks are deleted as soon as they are consumed.
+
+Narration state and per-stage ffmpeg work stay bounded. Music and SFX
+cues are still collected into lists (the SFX mix sorts them), so RAM
+grows with the SFX count. Temp disk is not bounded either: every beat
+MP3 exists between phases 1 and 3, and the browser recording is one
+webm kept until assembly. The report shows the temp-dir high-water mark
+and, separately, how much the persistent music bed cache grew.
+"""
+
+import tempfile
+from pathlib import Path
+
+from rich.console import Console
+
+from .audio_mixer import MUSIC_CACHE_DIR, build_narration_track_streaming
+from .models import EpisodeScript
+from .narration import beat_audio_path, iter_narrations
+from .phases import (
+    assemble_episode, episode_duration_s, mix_layers,
+    print_narration_summary, print_phase, record_playback,
+)
+from .recorder import iter_cue_log
+from .resources import ResourceMonitor
+
+
+async def render_streaming(
+    script: EpisodeScript,
+    script_path: Path,
+    output_dir: Path,
+    console: Console,
+) -> None:
+    """Render an episode in streaming mode and report peak RSS and temp disk."""
+    with tempfile.TemporaryDirectory(prefix="ramayana_") as tmp:
+        tmp_path = Path(tmp)
+        audio_dir = tmp_path / "audio"
+        audio_dir.mkdir()
+        video_dir = tmp_path / "video"
+        video_dir.mkdir()
+
+        async with ResourceMonitor(tmp_path, cache_dir=MUSIC_CACHE_DIR) as monitor:
+            # Phase 1: Generate narrations, keeping only durations in memory
+            print_phase(console, 1, "Generating narrations (streaming)")
+            srt_output = output_dir / f"{script.episode.id}.srt"
+            durations: list[int] = []
+            with open(srt_output, "w", encoding="utf-8") as srt:
+                wrote_srt = False
+                async for narration in iter_narrations(
+                    texts=script.all_narration_texts(),
+                    output_dir=audio_dir,
+                    voice=script.episode.narration.voice,
+                    rate=script.episode.narration.rate,
+                ):
+                    durations.append(narration.duration_ms)
+                    if narration.srt_text.strip():
+                        if wrote_srt:
+                            srt.write("\n\n")
+                        srt.write(narration.srt_text)
+                        wrote_srt = True
+            monitor.sample()
+            print_narration_summary(console, durations)
+
+            # Phase 2: Record browser, paging the cue log to disk
+            cue_log_path = tmp_path / "cues.jsonl"
+            recording = await record_playback(
+                console, script, script_path, durations, video_dir, cue_log_path
+            )
+            monitor.sample()
+
+            # Phase 3: Build audio layers
+            print_phase(console, 3, "Mixing audio layers (windowed)")
+            music_cues = []
+            sfx_cues = []
+            last_ts = 0
+            for cue in iter_cue_log(cue_log_path):
+                if cue["type"] == "music":
+                    music_cues.append(cue)
+                elif cue["type"] == "sfx":
+                    sfx_cues.append(cue)
+                elif cue["type"] == "narration_mark":
+                    last_ts = cue["wall_clock_ms"]
+            total_duration_s = episode_duration_s(last_ts, durations)
+
+            narration_marks = (c for c in iter_cue_log(cue_log_path) if c["type"] == "narration_mark")
+            narration_clips = (
+                (beat_audio_path(audio_dir, i), cue["wall_clock_ms"])
+                for i, cue in enumerate(narration_marks)
+                if i < len(durations) and durations[i] > 0
+            )
+            narration_track = await build_narration_track_streaming(
+                narration_clips, tmp_path / "narration.aac", delete_inputs=True
+            )
+            cue_log_path.unlink()
+            monitor.sample()
+
+            mixed_audio = await mix_layers(
+                narration_track, music_cues, sfx_cues,
+                script_path, total_duration_s, tmp_path, delete_stems=True,
+            )
+            monitor.sample()
+
+            # Phase 4: Assemble final video
+            await assemble_episode(
+                console, script, recording.video_path, mixed_audio, srt_output, output_dir
+            )
+
+        report = monitor.report()
+        console.print(
+            f"  Peak RSS: {report.peak_rss_mb:.0f} MB "
+            f"(largest child process: {report.peak_child_rss_mb:.0f} MB)"
+        )
+        console.print(f"  Peak temp disk: {report.peak_temp_disk_mb:.0f} MB")
+        console.print(f"  Music cache growth: {report.cache_growth_mb:.0f} MB ({MUSIC_CACHE_DIR})")
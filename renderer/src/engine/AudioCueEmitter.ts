@@ -69,6 +69,11 @@ export class AudioCueEmitter {
     return [...this.cueLog];
   }
 
+  /** Get a page of the cue log, so long episodes can be fetched incrementally. */
+  getCueLogSlice(start: number, end: number): AudioCue[] {
+    return this.cueLog.slice(start, end);
+  }
+
   /** Reset for a new recording. */
   reset(): void {
     this.cueLog = [];
@@ -77,6 +77,11 @@ export class SceneManager {
     console.log("[SceneManager] Preloading assets...");
   }
 
+  /** Swap in an edited episode script (live preview). */
+  setEpisodeData(episodeData: unknown): void {
+    this.episodeData = episodeData;
+  }
+
   getScenes(): SceneData[] {
     return this.episodeData.scenes || [];
   }
@@ -200,8 +205,8 @@ export class SceneManager {
       case "music_change":
         this.audioCueEmitter.emitMusic(
           action.track as string,
-          (action.volume as number) || 0.5,
-          (action.fade_in as number) || 1000
+          (action.volume as number) ?? 0.5,
+          (action.fade_in as number) ?? 1000
         );
         break;
 
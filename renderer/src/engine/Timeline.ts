@@ -14,6 +14,9 @@ export class Timeline {
   private sceneManager: SceneManager;
   private audioCueEmitter: AudioCueEmitter;
   private startTime: number = 0;
+  private playId: number = 0;
+  private running: Promise<void> = Promise.resolve();
+  private cancelWait: (() => void) | null = null;
 
   constructor(sceneManager: SceneManager, audioCueEmitter: AudioCueEmitter) {
     this.sceneManager = sceneManager;
@@ -21,21 +24,50 @@ export class Timeline {
   }
 
   /**
-   * Play the full episode timeline.
+   * Play the episode timeline.
    * @param beatDurations - Array of narration durations in ms, one per beat across all scenes.
+   * @param startScene - Scene index to start from (live preview jumps to the edited scene).
+   *
+   * A play superseded by a newer one stops at its next await, and the newer
+   * one only starts once it has, so the two never share the stage or cue log.
    */
-  async play(beatDurations: number[]): Promise<void> {
+  async play(beatDurations: number[], startScene: number = 0): Promise<void> {
+    const playId = ++this.playId;
+    this.cancelWait?.();
+    const previous = this.running;
+    let finished!: () => void;
+    this.running = new Promise((resolve) => (finished = resolve));
+    try {
+      await previous;
+      if (playId !== this.playId) return;
+      await this.run(beatDurations, startScene, playId);
+    } finally {
+      finished();
+    }
+  }
+
+  /** Abandon the current playback; it stops at its next scene or beat await. */
+  stop(): void {
+    this.playId++;
+    this.cancelWait?.();
+  }
+
+  private async run(beatDurations: number[], startScene: number, playId: number): Promise<void> {
+    this.audioCueEmitter.reset();
     this.startTime = performance.now();
     this.audioCueEmitter.setStartTime(this.startTime);
 
     const scenes = this.sceneManager.getScenes();
-    let beatIndex = 0;
+    let beatIndex = scenes
+      .slice(0, startScene)
+      .reduce((count, scene) => count + scene.beats.length, 0);
 
-    for (let sceneIdx = 0; sceneIdx < scenes.length; sceneIdx++) {
+    for (let sceneIdx = startScene; sceneIdx < scenes.length; sceneIdx++) {
       const scene = scenes[sceneIdx];
 
       // Load and transition into the scene
       await this.sceneManager.loadScene(sceneIdx);
+      if (playId !== this.playId) return;
 
       // Play each beat in the scene
       for (const beat of scene.beats) {
@@ -60,6 +92,7 @@ export class Timeline {
           Promise.all(actionPromises),
           this.wait(duration),
         ]);
+        if (playId !== this.playId) return;
 
         beatIndex++;
       }
@@ -68,7 +101,16 @@ export class Timeline {
     console.log(`[Timeline] Episode complete. ${beatIndex} beats played.`);
   }
 
+  /** Resolve after ms, or early if playback is stopped or superseded. */
   private wait(ms: number): Promise<void> {
-    return new Promise((resolve) => setTimeout(resolve, ms));
+    return new Promise((resolve) => {
+      const done = () => {
+        clearTimeout(timer);
+        if (this.cancelWait === done) this.cancelWait = null;
+        resolve();
+      };
+      const timer = setTimeout(done, ms);
+      this.cancelWait = done;
+    });
   }
 }
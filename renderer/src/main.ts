@@ -15,6 +15,9 @@ interface WindowAPI {
   startPlayback: () => Promise<void>;
   playbackComplete: boolean;
   getAudioCueLog: () => AudioCue[];
+  getAudioCueLogSlice: (start: number, end: number) => AudioCue[];
+  loadEpisode: (episodeData: unknown) => Promise<void>;
+  playFromScene: (sceneIndex: number) => Promise<void>;
 }
 
 interface AudioCue {
@@ -33,10 +36,11 @@ let beatDurations: number[] = [];
 let sceneManager: SceneManager | null = null;
 let timeline: Timeline | null = null;
 const audioCueEmitter = new AudioCueEmitter();
+let app: Application | null = null;
 
 async function init() {
   // Create PixiJS application
-  const app = new Application();
+  app = new Application();
   await app.init({
     width: 1920,
     height: 1080,
@@ -47,7 +51,7 @@ async function init() {
 
   // Scale canvas to fit browser viewport while maintaining 1920x1080 aspect ratio
   function fitCanvas() {
-    const canvas = app.canvas as HTMLCanvasElement;
+    const canvas = app!.canvas as HTMLCanvasElement;
     const scaleX = window.innerWidth / 1920;
     const scaleY = window.innerHeight / 1080;
     const scale = Math.min(scaleX, scaleY);
@@ -70,14 +74,26 @@ async function init() {
     return;
   }
 
+  await loadEpisode(episodeData);
+  console.log("[ramayana-engine] Initialized. Waiting for beat durations.");
+}
+
+/** Create the engine for an episode, or swap the script into the running one. */
+async function loadEpisode(episodeData: unknown) {
+  if (!app) throw new Error("Renderer not initialized");
+
+  if (sceneManager && timeline) {
+    timeline.stop();
+    sceneManager.setEpisodeData(episodeData);
+    return;
+  }
+
   // Initialize scene manager
   sceneManager = new SceneManager(app, episodeData, audioCueEmitter);
   await sceneManager.preloadAssets();
 
   // Initialize timeline
   timeline = new Timeline(sceneManager, audioCueEmitter);
-
-  console.log("[ramayana-engine] Initialized. Waiting for beat durations.");
 }
 
 // --- Playwright Control API ---
@@ -104,5 +120,26 @@ window.getAudioCueLog = () => {
   return audioCueEmitter.getCueLog();
 };
 
+window.getAudioCueLogSlice = (start: number, end: number) => {
+  return audioCueEmitter.getCueLogSlice(start, end);
+};
+
+// --- Live preview API (driven by `ramayana-engine preview`) ---
+
+window.loadEpisode = async (episodeData: unknown) => {
+  await ready;
+  await loadEpisode(episodeData);
+  console.log("[ramayana-engine] Episode script reloaded.");
+};
+
+window.playFromScene = async (sceneIndex: number) => {
+  await ready;
+  if (!timeline || !sceneManager) {
+    throw new Error("Engine not initialized");
+  }
+  console.log(`[ramayana-engine] Playing from scene ${sceneIndex}...`);
+  await timeline.play(beatDurations, sceneIndex);
+};
+
 // Boot
-init();
+const ready = init();
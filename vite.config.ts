@@ -11,7 +11,7 @@ export default defineConfig({
   publicDir: resolve(__dirname, "public-dev"),
   server: {
     port: 3000,
-    open: true,
+    open: !process.env.RAMAYANA_PREVIEW,
     fs: {
       allow: [".."],
     },